@@ -4,20 +4,58 @@ Advanced Features Example
 This script demonstrates advanced Qdrant features like filtering, batch operations, and collection management.
 """
 
+import asyncio
+
 import numpy as np
-from qdrant_client import QdrantClient
+from numpy.random import default_rng
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
-    Distance, VectorParams, PointStruct, 
-    Filter, FieldCondition, MatchValue, Range
+    Distance, VectorParams, Batch,
+    Filter, FieldCondition, MatchValue, Range, PayloadSchemaType, SearchRequest
+)
+
+from vector_utils import QUANTIZATION_CONFIG, normalize
+
+# Filters used by the search demo, built once at import time
+# 1. Filter by category
+TECH_FILTER = Filter(
+    must=[
+        FieldCondition(
+            key="category",
+            match=MatchValue(value="tech")
+        )
+    ]
+)
+# 2. Filter by year range
+YEAR_FILTER = Filter(
+    must=[
+        FieldCondition(
+            key="year",
+            range=Range(gte=2022, lte=2024)
+        )
+    ]
+)
+# 3. Complex filter (category AND year)
+SCIENCE_2023_FILTER = Filter(
+    must=[
+        FieldCondition(
+            key="category",
+            match=MatchValue(value="science")
+        ),
+        FieldCondition(
+            key="year",
+            match=MatchValue(value=2023)
+        )
+    ]
 )
 
-def main():
+async def main():
     """Main function to demonstrate advanced Qdrant features."""
     print("🚀 Starting Advanced Features Example")
     
     # Connect to Qdrant
     try:
-        client = QdrantClient("localhost", port=6333)
+        client = AsyncQdrantClient("localhost", grpc_port=6334, prefer_grpc=True)
         print("✅ Connected to Qdrant successfully")
     except Exception as e:
         print(f"❌ Failed to connect to Qdrant: {e}")
@@ -28,139 +66,113 @@ def main():
     
     # Create collection
     try:
-        client.create_collection(
+        await client.create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.DOT),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         print(f"✅ Created collection: {collection_name}")
     except Exception as e:
         print(f"⚠️  Collection might already exist: {e}")
     
+    # Index the payload fields used by the filtered searches below
+    try:
+        await client.create_payload_index(
+            collection_name, field_name="category", field_schema=PayloadSchemaType.KEYWORD
+        )
+        await client.create_payload_index(
+            collection_name, field_name="year", field_schema=PayloadSchemaType.INTEGER
+        )
+        print("✅ Created payload indexes on 'category' and 'year'")
+    except Exception as e:
+        print(f"⚠️  Could not create payload indexes: {e}")
+    
     # Generate sample data with different categories and metadata
     print("📊 Generating sample data with metadata...")
     categories = ["tech", "science", "history", "fiction"]
-    points = []
-    
-    for i in range(50):
-        vector = np.random.rand(384).tolist()
-        category = categories[i % len(categories)]
-        year = 2020 + (i % 5)  # Years 2020-2024
-        
-        points.append(
-            PointStruct(
-                id=i,
-                vector=vector,
-                payload={
-                    "text": f"Document {i} about {category}",
-                    "category": category,
-                    "year": year,
-                    "length": len(f"Document {i} about {category}"),
-                    "tags": [category, f"year_{year}", f"doc_{i}"]
-                }
-            )
-        )
+    rng = default_rng(0)
+    # Keep the data as parallel columns: one contiguous (50, 384) float32 matrix
+    # (~77 KB) plus id and payload arrays, instead of 50 point objects
+    vectors = normalize(rng.random((50, 384), dtype=np.float32))  # one RNG call for all 50 documents
+    query_vectors = normalize(rng.random((3, 384), dtype=np.float32))  # one query per filter demo
+    ids = np.arange(len(vectors), dtype=np.int64)
+    doc_categories = [categories[i % len(categories)] for i in range(len(ids))]
+    years = 2020 + ids % 5  # Years 2020-2024
+    payloads = [
+        {
+            "text": f"Document {i} about {category}",
+            "category": category,
+            "year": int(year),
+            "length": len(f"Document {i} about {category}"),
+            "tags": [category, f"year_{year}", f"doc_{i}"]
+        }
+        for i, category, year in zip(ids.tolist(), doc_categories, years)
+    ]
     
-    # Batch insert with progress
+    # Upsert in batches, sending all batches concurrently
     print("📝 Inserting data in batches...")
-    batch_size = 10
-    for i in range(0, len(points), batch_size):
-        batch = points[i:i + batch_size]
-        try:
-            client.upsert(collection_name=collection_name, points=batch)
-            print(f"✅ Inserted batch {i//batch_size + 1}/{(len(points) + batch_size - 1)//batch_size}")
-        except Exception as e:
-            print(f"❌ Failed to insert batch: {e}")
-            return
+    batch_size = 32
+    batches = [
+        Batch(
+            ids=ids[i:i + batch_size].tolist(),
+            vectors=vectors[i:i + batch_size],
+            payloads=payloads[i:i + batch_size]
+        )
+        for i in range(0, len(ids), batch_size)
+    ]
+    try:
+        await asyncio.gather(*(
+            client.upsert(collection_name=collection_name, points=batch, wait=True)
+            for batch in batches
+        ))
+        print(f"✅ Inserted {len(ids)} points in {len(batches)} batches")
+    except Exception as e:
+        print(f"❌ Failed to insert batch: {e}")
+        return
     
     # Demonstrate filtering
     print("\n🔍 Demonstrating filtering capabilities:")
     
-    # 1. Filter by category
-    print("\n--- Filtering by category 'tech' ---")
-    try:
-        tech_results = client.search(
-            collection_name=collection_name,
-            query_vector=np.random.rand(384).tolist(),
-            query_filter=Filter(
-                must=[
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value="tech")
-                    )
-                ]
-            ),
-            limit=5
-        )
-        
-        for i, result in enumerate(tech_results, 1):
-            print(f"{i}. Score: {result.score:.4f} - {result.payload['text']} (Year: {result.payload['year']})")
-            
-    except Exception as e:
-        print(f"❌ Category filter failed: {e}")
-    
-    # 2. Filter by year range
-    print("\n--- Filtering by year range (2022-2024) ---")
-    try:
-        year_results = client.search(
-            collection_name=collection_name,
-            query_vector=np.random.rand(384).tolist(),
-            query_filter=Filter(
-                must=[
-                    FieldCondition(
-                        key="year",
-                        range=Range(gte=2022, lte=2024)
-                    )
-                ]
-            ),
-            limit=5
-        )
-        
-        for i, result in enumerate(year_results, 1):
-            print(f"{i}. Score: {result.score:.4f} - {result.payload['text']} (Year: {result.payload['year']})")
-            
-    except Exception as e:
-        print(f"❌ Year filter failed: {e}")
+    # Send the three filtered searches in a single batch request
+    requests = [
+        SearchRequest(vector=query_vectors[0], filter=TECH_FILTER, limit=5, with_payload=True),
+        SearchRequest(vector=query_vectors[1], filter=YEAR_FILTER, limit=5, with_payload=True),
+        SearchRequest(vector=query_vectors[2], filter=SCIENCE_2023_FILTER, limit=5, with_payload=True),
+    ]
     
-    # 3. Complex filter (category AND year)
-    print("\n--- Complex filter: science documents from 2023 ---")
     try:
-        complex_results = client.search(
+        tech_results, year_results, complex_results = await client.search_batch(
             collection_name=collection_name,
-            query_vector=np.random.rand(384).tolist(),
-            query_filter=Filter(
-                must=[
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value="science")
-                    ),
-                    FieldCondition(
-                        key="year",
-                        match=MatchValue(value=2023)
-                    )
-                ]
-            ),
-            limit=5
+            requests=requests
         )
         
-        for i, result in enumerate(complex_results, 1):
-            print(f"{i}. Score: {result.score:.4f} - {result.payload['text']} (Year: {result.payload['year']})")
+        searches = [
+            ("Filtering by category 'tech'", tech_results),
+            ("Filtering by year range (2022-2024)", year_results),
+            ("Complex filter: science documents from 2023", complex_results),
+        ]
+        for title, results in searches:
+            print(f"\n--- {title} ---")
+            for i, result in enumerate(results, 1):
+                print(f"{i}. Score: {result.score:.4f} - {result.payload['text']} (Year: {result.payload['year']})")
             
     except Exception as e:
-        print(f"❌ Complex filter failed: {e}")
+        print(f"❌ Filtered search failed: {e}")
     
     # Collection management
     print("\n📋 Collection Management:")
     
     # List all collections
     try:
-        collections = client.get_collections()
+        collections = await client.get_collections()
         print(f"Available collections: {[col.name for col in collections.collections]}")
     except Exception as e:
         print(f"❌ Failed to list collections: {e}")
     
     # Get collection info
     try:
-        collection_info = client.get_collection(collection_name)
+        collection_info = await client.get_collection(collection_name)
         print(f"Collection '{collection_name}' info:")
         print(f"  - Vector size: {collection_info.config.params.vectors.size}")
         print(f"  - Distance: {collection_info.config.params.vectors.distance}")
@@ -170,12 +182,13 @@ def main():
     
     # Clean up
     try:
-        client.delete_collection(collection_name)
+        await client.delete_collection(collection_name)
         print(f"\n🧹 Cleaned up collection: {collection_name}")
     except Exception as e:
         print(f"⚠️  Could not delete collection: {e}")
     
+    await client.close()
     print("🎉 Advanced features example completed!")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
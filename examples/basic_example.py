@@ -6,7 +6,9 @@ This script demonstrates the core functionality of Qdrant vector database.
 
 import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import Distance, VectorParams
+
+from vector_utils import QUANTIZATION_CONFIG, normalize
 
 def main():
     """Main function to demonstrate Qdrant basics."""
@@ -14,7 +16,7 @@ def main():
     
     # Connect to Qdrant
     try:
-        client = QdrantClient("localhost", port=6333)
+        client = QdrantClient("localhost", grpc_port=6334, prefer_grpc=True)
         print("✅ Connected to Qdrant successfully")
     except Exception as e:
         print(f"❌ Failed to connect to Qdrant: {e}")
@@ -26,7 +28,9 @@ def main():
     try:
         client.create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.DOT),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         print(f"✅ Created collection: {collection_name}")
     except Exception as e:
@@ -34,29 +38,29 @@ def main():
     
     # Generate sample data
     print("📊 Generating sample data...")
-    vectors = np.random.rand(10, 384).tolist()  # 10 documents with 384-dimensional vectors
+    vectors = normalize(np.random.rand(10, 384))  # 10 documents with 384-dimensional unit vectors
     
-    # Create points with IDs and payload
-    points = [
-        PointStruct(
-            id=i,
-            vector=vector,
-            payload={"text": f"Document {i}", "category": "sample", "index": i}
-        )
-        for i, vector in enumerate(vectors)
-    ]
+    ids = list(range(len(vectors)))
+    payloads = [{"text": f"Document {i}", "category": "sample", "index": i} for i in ids]
     
-    # Insert the points
+    # Upload the points; the client handles batching and retries
     try:
-        client.upsert(collection_name=collection_name, points=points)
-        print(f"✅ Inserted {len(points)} points into collection")
+        client.upload_collection(
+            collection_name=collection_name,
+            vectors=vectors,
+            payload=payloads,
+            ids=ids,
+            batch_size=32,
+            wait=True
+        )
+        print(f"✅ Inserted {len(ids)} points into collection")
     except Exception as e:
         print(f"❌ Failed to insert points: {e}")
         return
     
     # Perform similarity search
     print("🔍 Performing similarity search...")
-    query_vector = np.random.rand(384).tolist()
+    query_vector = normalize(np.random.rand(384))
     
     try:
         search_result = client.search(
@@ -2,51 +2,108 @@
 """
 Document Search Example
 This script demonstrates a complete document search system using Qdrant.
+Pass --local to search the documents in memory with SimSIMD (or a Numba kernel)
+instead; for a handful of documents that is far cheaper than a round trip to the server.
+The Numba kernel is optional (`pip install .[numba]`) and only used when SimSIMD is missing.
 """
 
+import argparse
+import hashlib
+
 import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import Distance, VectorParams, Batch
+
+from vector_utils import QUANTIZATION_CONFIG, normalize
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 def simple_embedding(text):
     """Generate a simple embedding for demonstration purposes.
     In production, use proper embedding models like sentence-transformers."""
-    # Create a deterministic embedding based on text content
-    np.random.seed(hash(text) % 2**32)
-    return np.random.rand(384).tolist()
+    # Seed a private generator from a stable hash of the text, leaving the global RNG untouched
+    seed = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    rng = np.random.default_rng(int.from_bytes(seed, "little"))
+    return normalize(rng.random(384, dtype=np.float32))
 
-def main():
-    """Main function to demonstrate document search."""
-    print("📚 Starting Document Search Example")
+def embed_many(texts):
+    """Generate simple embeddings for a list of texts as one (len(texts), 384) float32 array."""
+    out = np.empty((len(texts), 384), dtype=np.float32)
+    for i, text in enumerate(texts):
+        out[i] = simple_embedding(text)
+    return out
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def dot_scores(corpus, q):
+        """Dot product of every corpus row with q, computed in a single compiled pass.
+        The embeddings are unit-length, so this is their cosine similarity."""
+        N, D = corpus.shape
+        scores = np.empty(N, np.float32)
+        for i in prange(N):
+            s = 0.0
+            for d in range(D):
+                s += corpus[i, d] * q[d]
+            scores[i] = s
+        return scores
+
+def local_search(corpus, query_vector, limit):
+    """Return (index, score) pairs for the `limit` corpus rows most similar to the query.
+    Scores are cosine similarities, which for the unit-length embeddings match Qdrant's Distance.DOT."""
+    if simsimd is not None:
+        distances = np.asarray(simsimd.cosine(query_vector, corpus))
+    elif njit is not None:
+        distances = 1.0 - dot_scores(corpus, query_vector)
+    else:
+        norms = np.linalg.norm(corpus, axis=1) * np.linalg.norm(query_vector)
+        distances = 1.0 - (corpus @ query_vector) / norms
+    
+    k = min(limit, len(corpus))
+    top = np.argpartition(distances, k - 1)[:k]
+    top = top[np.argsort(distances[top])]
+    return [(int(i), 1.0 - float(distances[i])) for i in top]
+
+def search_locally(documents, test_queries):
+    """Search the documents in memory without contacting Qdrant."""
+    backend = "SimSIMD" if simsimd is not None else "Numba" if njit is not None else "NumPy"
+    print(f"⚡ Searching {len(documents)} documents locally ({backend})")
+    corpus = embed_many(documents)
+    query_vectors = embed_many(test_queries)
     
+    print("\n🔍 Testing different search queries:")
+    for query, query_vector in zip(test_queries, query_vectors):
+        print(f"\n--- Searching for: '{query}' ---")
+        for i, (doc_id, score) in enumerate(local_search(corpus, query_vector, limit=3), 1):
+            print(f"{i}. Score: {score:.4f} - {documents[doc_id]}")
+
+def search_with_qdrant(documents, test_queries):
+    """Index the documents in a Qdrant collection and search it."""
     # Connect to Qdrant
     try:
-        client = QdrantClient("localhost", port=6333)
+        client = QdrantClient("localhost", grpc_port=6334, prefer_grpc=True)
         print("✅ Connected to Qdrant successfully")
     except Exception as e:
         print(f"❌ Failed to connect to Qdrant: {e}")
         print("Make sure Qdrant is running with: docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
         return
     
-    # Sample documents
-    documents = [
-        "The quick brown fox jumps over the lazy dog",
-        "A quick brown dog jumps over the lazy fox",
-        "The lazy fox sleeps while the quick brown dog watches",
-        "A brown fox and a lazy dog are friends",
-        "The quick dog runs fast and jumps high",
-        "A lazy cat sleeps on the windowsill",
-        "The brown cat chases the quick mouse",
-        "A quick mouse escapes from the brown cat"
-    ]
-    
     collection_name = "documents"
     
     # Create collection
     try:
         client.create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.DOT),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         print(f"✅ Created collection: {collection_name}")
     except Exception as e:
@@ -54,35 +111,25 @@ def main():
     
     # Insert documents
     print("📝 Inserting documents...")
-    points = []
-    for i, doc in enumerate(documents):
-        points.append(
-            PointStruct(
-                id=i,
-                vector=simple_embedding(doc),
-                payload={"text": doc, "doc_id": i, "length": len(doc)}
-            )
-        )
+    ids = list(range(len(documents)))
+    points = Batch(
+        ids=ids,
+        vectors=embed_many(documents),
+        payloads=[{"text": doc, "doc_id": i, "length": len(doc)} for i, doc in enumerate(documents)]
+    )
     
     try:
         client.upsert(collection_name=collection_name, points=points)
-        print(f"✅ Inserted {len(points)} documents")
+        print(f"✅ Inserted {len(ids)} documents")
     except Exception as e:
         print(f"❌ Failed to insert documents: {e}")
         return
     
-    # Test different search queries
-    test_queries = [
-        "quick brown fox",
-        "lazy dog",
-        "cat mouse",
-        "sleeping animals"
-    ]
+    query_vectors = embed_many(test_queries)
     
     print("\n🔍 Testing different search queries:")
-    for query in test_queries:
+    for query, query_vector in zip(test_queries, query_vectors):
         print(f"\n--- Searching for: '{query}' ---")
-        query_vector = simple_embedding(query)
         
         try:
             results = client.search(
@@ -103,8 +150,42 @@ def main():
         print(f"\n🧹 Cleaned up collection: {collection_name}")
     except Exception as e:
         print(f"⚠️  Could not delete collection: {e}")
+
+def main():
+    """Main function to demonstrate document search."""
+    parser = argparse.ArgumentParser(description="Qdrant document search example")
+    parser.add_argument("--local", action="store_true",
+                        help="search the documents in memory instead of through Qdrant")
+    args = parser.parse_args()
+    
+    print("📚 Starting Document Search Example")
+    
+    # Sample documents
+    documents = [
+        "The quick brown fox jumps over the lazy dog",
+        "A quick brown dog jumps over the lazy fox",
+        "The lazy fox sleeps while the quick brown dog watches",
+        "A brown fox and a lazy dog are friends",
+        "The quick dog runs fast and jumps high",
+        "A lazy cat sleeps on the windowsill",
+        "The brown cat chases the quick mouse",
+        "A quick mouse escapes from the brown cat"
+    ]
+    
+    # Test different search queries
+    test_queries = [
+        "quick brown fox",
+        "lazy dog",
+        "cat mouse",
+        "sleeping animals"
+    ]
+    
+    if args.local:
+        search_locally(documents, test_queries)
+    else:
+        search_with_qdrant(documents, test_queries)
     
     print("🎉 Document search example completed!")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Vector and collection helpers shared by the example scripts.
+"""
+
+import numpy as np
+from qdrant_client.models import ScalarQuantization, ScalarQuantizationConfig, ScalarType
+
+# Int8 scalar quantization used by every example collection
+QUANTIZATION_CONFIG = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+)
+
+def normalize(v):
+    """Scale vectors to unit length so a dot product equals their cosine similarity."""
+    n = np.linalg.norm(v, axis=-1, keepdims=True)
+    return (v / np.where(n == 0, 1, n)).astype(np.float32)
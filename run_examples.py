@@ -4,18 +4,27 @@ Main script to run Qdrant examples and tests
 """
 
 import sys
+import signal
+import socket
 import subprocess
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+_print_lock = threading.Lock()
+_running_lock = threading.Lock()
+_running_processes = set()
+
 def check_qdrant_running():
-    """Check if Qdrant is running on localhost:6333."""
-    try:
-        import requests
-        response = requests.get("http://localhost:6333/collections", timeout=5)
-        return response.status_code == 200
-    except:
-        return False
+    """Check if Qdrant is accepting connections on localhost:6333 (HTTP) and 6334 (gRPC)."""
+    for port in (6333, 6334):
+        try:
+            with socket.create_connection(("localhost", port), timeout=0.5):
+                pass
+        except OSError:
+            return False
+    return True
 
 def start_qdrant():
     """Start Qdrant using Docker."""
@@ -65,29 +74,88 @@ def install_dependencies():
         print(f"❌ Failed to install dependencies: {e}")
         return False
 
+def _kill_process_group(process):
+    """Kill a process started by stream_command together with its children."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        process.kill()
+
+def kill_running_commands():
+    """Kill every command currently running under stream_command."""
+    with _running_lock:
+        processes = list(_running_processes)
+    for process in processes:
+        _kill_process_group(process)
+
+def stream_command(cmd, timeout, prefix=""):
+    """Run a command, echoing its combined stdout/stderr line by line as it is produced.
+    Returns the exit code, or raises subprocess.TimeoutExpired if the command
+    is still running after `timeout` seconds."""
+    # Run the command in its own session so a timeout can kill any grandchildren
+    # (e.g. the Python process started by `uv run`) that hold the pipe open.
+    # Unbuffered output makes Python children write each line as it is printed.
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1, start_new_session=True,
+                               env={**os.environ, "PYTHONUNBUFFERED": "1"})
+    with _running_lock:
+        _running_processes.add(process)
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        _kill_process_group(process)
+    
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in process.stdout:
+            with _print_lock:
+                sys.stdout.write(prefix + line)
+        returncode = process.wait()
+    except BaseException:
+        # The child is outside the terminal's process group, so Ctrl-C never reaches it
+        _kill_process_group(process)
+        process.wait()
+        raise
+    finally:
+        timer.cancel()
+        with _running_lock:
+            _running_processes.discard(process)
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode
+
 def run_example(example_name, script_path):
-    """Run a specific example script."""
-    print(f"\n{'='*50}")
-    print(f"🚀 Running {example_name}")
-    print(f"{'='*50}")
+    """Run a specific example script.
+    Output lines are prefixed with the example name, so examples running
+    in parallel can be told apart."""
+    with _print_lock:
+        print(f"\n{'='*50}")
+        print(f"🚀 Running {example_name}")
+        print(f"{'='*50}")
     
     try:
         # Use uv run directly instead of uv run python
-        result = subprocess.run(["uv", "run", script_path], 
-                              capture_output=True, text=True, timeout=60)
+        returncode = stream_command(["uv", "run", script_path], timeout=60,
+                                    prefix=f"[{example_name}] ")
         
-        if result.returncode == 0:
-            print("✅ Example completed successfully!")
-            print(result.stdout)
-        else:
-            print("❌ Example failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+        with _print_lock:
+            if returncode == 0:
+                print(f"✅ {example_name} completed successfully!")
+            else:
+                print(f"❌ {example_name} failed!")
             
     except subprocess.TimeoutExpired:
-        print("⏰ Example timed out after 60 seconds")
+        with _print_lock:
+            print(f"⏰ {example_name} timed out after 60 seconds")
     except Exception as e:
-        print(f"❌ Error running example: {e}")
+        with _print_lock:
+            print(f"❌ Error running {example_name}: {e}")
 
 def run_tests():
     """Run the test suite."""
@@ -97,14 +165,9 @@ def run_tests():
     
     try:
         # Use uv run directly instead of uv run python
-        result = subprocess.run(["uv", "run", "pytest", "tests/", "-v"], 
-                              capture_output=True, text=True, timeout=120)
+        returncode = stream_command(["uv", "run", "pytest", "tests/", "-v"], timeout=120)
         
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-            
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ All tests passed!")
         else:
             print("❌ Some tests failed!")
@@ -152,12 +215,28 @@ def main():
         ("Advanced Features", "examples/advanced_features.py")
     ]
     
+    # Each example uses its own collection, so they can safely run side by side
     for name, path in examples:
-        if os.path.exists(path):
-            run_example(name, path)
-        else:
+        if not os.path.exists(path):
             print(f"⚠️  Example file not found: {path}")
     
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = {
+            executor.submit(run_example, name, path): name
+            for name, path in examples if os.path.exists(path)
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    with _print_lock:
+                        print(f"❌ Error running {futures[future]}: {e}")
+        except KeyboardInterrupt:
+            # Ctrl-C only interrupts this thread; stop the workers' children too
+            kill_running_commands()
+            raise
+    
     # Run tests
     if os.path.exists("tests/"):
         run_tests()
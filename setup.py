@@ -37,6 +37,9 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
         ],
+        "numba": [
+            "numba>=0.57.0",
+        ],
     },
     entry_points={
         "console_scripts": [
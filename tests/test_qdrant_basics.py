@@ -3,19 +3,36 @@
 Test suite for Qdrant basics
 """
 
+import uuid
+
 import pytest
 import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance, VectorParams, Batch,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType
+)
+
+@pytest.fixture(scope="session")
+def qclient():
+    """Qdrant client shared by the whole test session."""
+    client = QdrantClient("localhost", grpc_port=6334, prefer_grpc=True)
+    yield client
+    client.close()
+
+# Int8 scalar quantization applied to every test collection
+QUANTIZATION_CONFIG = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+)
 
 class TestQdrantBasics:
     """Test class for basic Qdrant functionality."""
     
     @pytest.fixture(autouse=True)
-    def setup_client(self):
-        """Setup Qdrant client for each test."""
-        self.client = QdrantClient("localhost", port=6333)
-        self.collection_name = "test_collection"
+    def setup_client(self, qclient):
+        """Setup a uniquely named collection for each test."""
+        self.client = qclient
+        self.collection_name = f"test_{uuid.uuid4().hex}"
         yield
         # Cleanup after each test
         try:
@@ -33,37 +50,41 @@ class TestQdrantBasics:
         """Test creating a collection."""
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         
         # Verify collection exists
         collection_info = self.client.get_collection(self.collection_name)
         assert collection_info.config.params.vectors.size == 384
         assert collection_info.config.params.vectors.distance == Distance.COSINE
+        assert collection_info.config.params.on_disk_payload is True
+        assert collection_info.config.quantization_config.scalar.type == ScalarType.INT8
     
     def test_insert_and_search(self):
         """Test inserting data and performing search."""
         # Create collection
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         
         # Insert test data
-        vectors = np.random.rand(5, 384).tolist()
-        points = [
-            PointStruct(
-                id=i,
-                vector=vector,
-                payload={"text": f"Test document {i}"}
-            )
-            for i, vector in enumerate(vectors)
-        ]
+        vectors = np.random.rand(5, 384).astype(np.float32)
+        ids = list(range(len(vectors)))
+        points = Batch(
+            ids=ids,
+            vectors=vectors,
+            payloads=[{"text": f"Test document {i}"} for i in ids]
+        )
         
         self.client.upsert(collection_name=self.collection_name, points=points)
         
         # Perform search
-        query_vector = np.random.rand(384).tolist()
+        query_vector = np.random.rand(384).astype(np.float32)
         results = self.client.search(
             collection_name=self.collection_name,
             query_vector=query_vector,
@@ -81,7 +102,9 @@ class TestQdrantBasics:
         # Create collection
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+            vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+            quantization_config=QUANTIZATION_CONFIG,
+            on_disk_payload=True
         )
         
         # List collections